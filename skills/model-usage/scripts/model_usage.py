@@ -12,10 +12,13 @@ import json
 import os
 import subprocess
 import sys
+import time
 from dataclasses import dataclass
-from datetime import date, datetime, timedelta
+from datetime import date, timedelta
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+CODEXBAR_CACHE_TTL_SECONDS = 300
+
 
 def eprint(msg: str) -> None:
     print(msg, file=sys.stderr)
@@ -38,7 +41,50 @@ def run_codexbar_cost(provider: str) -> List[Dict[str, Any]]:
     return payload
 
 
-def load_payload(input_path: Optional[str], provider: str) -> Dict[str, Any]:
+def codexbar_cache_path(provider: str) -> str:
+    return os.path.join(os.path.expanduser("~"), ".cache", "openclaw", f"codexbar-cost-{provider}.json")
+
+
+def read_cached_codexbar_cost(path: str) -> Optional[List[Dict[str, Any]]]:
+    try:
+        age = time.time() - os.stat(path).st_mtime
+        if not 0 <= age < CODEXBAR_CACHE_TTL_SECONDS:
+            return None
+        with open(path, "r", encoding="utf-8") as handle:
+            payload = json.load(handle)
+    except (OSError, ValueError):
+        return None
+    return payload if isinstance(payload, list) else None
+
+
+def write_cached_codexbar_cost(path: str, payload: List[Dict[str, Any]]) -> None:
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump(payload, handle)
+        os.replace(tmp_path, path)
+    except OSError:
+        # The cache is best-effort; a failed write just means the next run calls codexbar again.
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_codexbar_cost(provider: str, use_cache: bool) -> List[Dict[str, Any]]:
+    if not use_cache:
+        return run_codexbar_cost(provider)
+    cache_path = codexbar_cache_path(provider)
+    cached = read_cached_codexbar_cost(cache_path)
+    if cached is not None:
+        return cached
+    payload = run_codexbar_cost(provider)
+    write_cached_codexbar_cost(cache_path, payload)
+    return payload
+
+
+def load_payload(input_path: Optional[str], provider: str, use_cache: bool = True) -> Dict[str, Any]:
     if input_path:
         if input_path == "-":
             raw = sys.stdin.read()
@@ -47,7 +93,7 @@ def load_payload(input_path: Optional[str], provider: str) -> Dict[str, Any]:
                 raw = handle.read()
         data = json.loads(raw)
     else:
-        data = run_codexbar_cost(provider)
+        data = load_codexbar_cost(provider, use_cache)
 
     if isinstance(data, dict):
         return data
@@ -78,7 +124,7 @@ def parse_daily_entries(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
 
 def parse_date(value: str) -> Optional[date]:
     try:
-        return datetime.strptime(value, "%Y-%m-%d").date()
+        return date.fromisoformat(value)
     except Exception:
         return None
 
@@ -138,8 +184,8 @@ def pick_current_model(entries: List[Dict[str, Any]]) -> Tuple[Optional[str], Op
                 if isinstance(model, str) and isinstance(cost, (int, float)):
                     scored.append(ModelCost(model=model, cost=float(cost)))
             if scored:
-                scored.sort(key=lambda item: item.cost, reverse=True)
-                return scored[0].model, entry.get("date") if isinstance(entry.get("date"), str) else None
+                top = max(scored, key=lambda item: item.cost)
+                return top.model, entry.get("date") if isinstance(entry.get("date"), str) else None
         models_used = entry.get("modelsUsed")
         if isinstance(models_used, list) and models_used:
             last = models_used[-1]
@@ -233,6 +279,12 @@ def build_json_all(provider: str, totals: Dict[str, float]) -> Dict[str, Any]:
     }
 
 
+def dump_json(payload: Dict[str, Any], pretty: bool) -> str:
+    if pretty:
+        return json.dumps(payload, indent=2, sort_keys=True)
+    return json.dumps(payload, separators=(",", ":"))
+
+
 def main() -> int:
     parser = argparse.ArgumentParser(description="Summarize CodexBar model usage from local cost logs.")
     parser.add_argument("--provider", choices=["codex", "claude"], default="codex")
@@ -242,11 +294,16 @@ def main() -> int:
     parser.add_argument("--days", type=int, help="Limit to last N days (based on daily rows).")
     parser.add_argument("--format", choices=["text", "json"], default="text")
     parser.add_argument("--pretty", action="store_true", help="Pretty-print JSON output.")
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help=f"Always run codexbar instead of reusing output cached for {CODEXBAR_CACHE_TTL_SECONDS // 60} minutes.",
+    )
 
     args = parser.parse_args()
 
     try:
-        payload = load_payload(args.input, args.provider)
+        payload = load_payload(args.input, args.provider, use_cache=not args.no_cache)
     except Exception as exc:
         eprint(str(exc))
         return 1
@@ -276,8 +333,7 @@ def main() -> int:
                 latest_cost_date=latest_cost_date,
                 entry_count=len(entries),
             )
-            indent = 2 if args.pretty else None
-            print(json.dumps(payload_out, indent=indent, sort_keys=args.pretty))
+            print(dump_json(payload_out, pretty=args.pretty))
         else:
             print(
                 render_text_current(
@@ -299,8 +355,7 @@ def main() -> int:
 
     if args.format == "json":
         payload_out = build_json_all(provider=args.provider, totals=totals)
-        indent = 2 if args.pretty else None
-        print(json.dumps(payload_out, indent=indent, sort_keys=args.pretty))
+        print(dump_json(payload_out, pretty=args.pretty))
     else:
         print(render_text_all(provider=args.provider, totals=totals))
     return 0
@@ -11,11 +11,13 @@ import urllib.error
 import urllib.request
 from pathlib import Path
 
+NON_SLUG_CHARS = re.compile(r"[^a-z0-9]+")
+
 
 def slugify(text: str) -> str:
     text = text.lower().strip()
-    text = re.sub(r"[^a-z0-9]+", "-", text)
-    text = re.sub(r"-{2,}", "-", text).strip("-")
+    # A run of any non-slug characters (dashes included) collapses to one dash.
+    text = NON_SLUG_CHARS.sub("-", text).strip("-")
     return text or "image"
 
 
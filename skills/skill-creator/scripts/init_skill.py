@@ -19,6 +19,7 @@ from pathlib import Path
 
 MAX_SKILL_NAME_LENGTH = 64
 ALLOWED_RESOURCES = {"scripts", "references", "assets"}
+NON_NAME_CHARS = re.compile(r"[^a-z0-9]+")
 
 SKILL_TEMPLATE = """---
 name: {skill_name}
@@ -193,11 +194,8 @@ Note: This is a text placeholder. Actual assets can be any file type.
 
 def normalize_skill_name(skill_name):
     """Normalize a skill name to lowercase hyphen-case."""
-    normalized = skill_name.strip().lower()
-    normalized = re.sub(r"[^a-z0-9]+", "-", normalized)
-    normalized = normalized.strip("-")
-    normalized = re.sub(r"-{2,}", "-", normalized)
-    return normalized
+    # A run of any non-name characters (hyphens included) collapses to one hyphen.
+    return NON_NAME_CHARS.sub("-", skill_name.strip().lower()).strip("-")
 
 
 def title_case_skill_name(skill_name):
@@ -215,13 +213,7 @@ def parse_resources(raw_resources):
         print(f"[ERROR] Unknown resource type(s): {', '.join(invalid)}")
         print(f"   Allowed: {allowed}")
         sys.exit(1)
-    deduped = []
-    seen = set()
-    for resource in resources:
-        if resource not in seen:
-            deduped.append(resource)
-            seen.add(resource)
-    return deduped
+    return list(dict.fromkeys(resources))
 
 
 def create_resource_dirs(skill_dir, skill_name, skill_title, resources, include_examples):
@@ -268,15 +260,13 @@ def init_skill(skill_name, path, resources, include_examples):
     # Determine skill directory path
     skill_dir = Path(path).resolve() / skill_name
 
-    # Check if directory already exists
-    if skill_dir.exists():
-        print(f"[ERROR] Skill directory already exists: {skill_dir}")
-        return None
-
-    # Create skill directory
+    # Create skill directory (mkdir fails atomically if it already exists)
     try:
         skill_dir.mkdir(parents=True, exist_ok=False)
         print(f"[OK] Created skill directory: {skill_dir}")
+    except FileExistsError:
+        print(f"[ERROR] Skill directory already exists: {skill_dir}")
+        return None
     except Exception as e:
         print(f"[ERROR] Error creating directory: {e}")
         return None
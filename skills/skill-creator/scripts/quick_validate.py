@@ -10,6 +10,20 @@ from pathlib import Path
 import yaml
 
 MAX_SKILL_NAME_LENGTH = 64
+SKILL_NAME_PATTERN = re.compile(r"^[a-z0-9-]+$")
+# Prefer the libyaml-backed loader when PyYAML was built with it.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(text):
+    """Parse YAML with the fastest safe loader available"""
+    try:
+        return yaml.load(text, Loader=YAML_LOADER)
+    except yaml.YAMLError:
+        if YAML_LOADER is yaml.SafeLoader:
+            raise
+        # libyaml errors omit the source snippet; re-parse for a readable message.
+        return yaml.load(text, Loader=yaml.SafeLoader)
 
 
 def validate_skill(skill_path):
@@ -24,14 +38,15 @@ def validate_skill(skill_path):
     if not content.startswith("---"):
         return False, "No YAML frontmatter found"
 
-    match = re.match(r"^---\n(.*?)\n---", content, re.DOTALL)
-    if not match:
+    # Same bounds as ^---\n(.*?)\n---, located with plain string scans.
+    end = content.find("\n---", 4) if content.startswith("---\n") else -1
+    if end == -1:
         return False, "Invalid frontmatter format"
 
-    frontmatter_text = match.group(1)
+    frontmatter_text = content[4:end]
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = load_yaml(frontmatter_text)
         if not isinstance(frontmatter, dict):
             return False, "Frontmatter must be a YAML dictionary"
     except yaml.YAMLError as e:
@@ -58,7 +73,7 @@ def validate_skill(skill_path):
         return False, f"Name must be a string, got {type(name).__name__}"
     name = name.strip()
     if name:
-        if not re.match(r"^[a-z0-9-]+$", name):
+        if not SKILL_NAME_PATTERN.match(name):
             return (
                 False,
                 f"Name '{name}' should be hyphen-case (lowercase letters, digits, and hyphens only)",